@@ -6,7 +6,12 @@
 module tb ();
 
   // Wire up the inputs and outputs:
+`ifdef HDL_CLOCK
+  wire clk;
+  hdl_clock i_hdl_clock (.clk(clk));
+`else
   reg clk;
+`endif
   reg rst_n;
   reg ena;
   reg [7:0] ui_in_base;
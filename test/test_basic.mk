@@ -58,6 +58,12 @@ endif
 
 # Include the testbench sources:
 VERILOG_SOURCES += $(PWD)/tb.v
+
+# Generate the clock in HDL instead of from a cocotb Clock
+ifeq ($(COCOTB_HDL_CLOCK),1)
+VERILOG_SOURCES += $(PWD)/user_peripherals/borg/hdl_clock.v
+COMPILE_ARGS    += -DHDL_CLOCK
+endif
 TOPLEVEL = tb
 
 # MODULE is the basename of the Python test file
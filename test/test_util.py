@@ -10,7 +10,7 @@ from riscvmodel.regnames import x0, gp, tp, a0
 
 async def reset(dut, latency=1, ui_in=0x80):
   # Reset
-  dut._log.info(f"Reset, latency {latency}")
+  dut._log.info("Reset, latency %d", latency)
   dut.ena.value = 1
   dut.ui_in_base.value = ui_in
   dut.uio_in.value = 0
@@ -140,26 +140,33 @@ async def start_write(dut, addr):
 nibble_shift_order = [4, 0, 12, 8, 20, 16, 28, 24]
 
 async def send_instr(dut, data, ok_to_exit=False, allow_long_delay=False):
+    # Look the handles up once, this is called for every instruction
+    clk = dut.clk
+    data_in = dut.qspi_data_in
+    flash_select = dut.qspi_flash_select
+    clk_out = dut.qspi_clk_out
+    data_oe = dut.qspi_data_oe
+
     instr_len = 8 if (data & 3) == 3 else 4
     for i in range(instr_len):
-        dut.qspi_data_in.value = (data >> (nibble_shift_order[i])) & 0xF
-        await ClockCycles(dut.clk, 1, False)
+        data_in.value = (data >> (nibble_shift_order[i])) & 0xF
+        await ClockCycles(clk, 1, False)
         for _ in range(400 if allow_long_delay else 20):
-            if ok_to_exit and dut.qspi_flash_select.value == 1:
+            if ok_to_exit and flash_select.value == 1:
                 return
-            assert dut.qspi_flash_select.value == 0
-            if dut.qspi_clk_out.value == 0:
-                await ClockCycles(dut.clk, 1, False)
+            assert flash_select.value == 0
+            if clk_out.value == 0:
+                await ClockCycles(clk, 1, False)
             else:
                 break
-        assert dut.qspi_clk_out.value == 1
-        assert dut.qspi_data_oe.value == 0
-        await ClockCycles(dut.clk, 1, False)
-        assert dut.qspi_clk_out.value == 0
+        assert clk_out.value == 1
+        assert data_oe.value == 0
+        await ClockCycles(clk, 1, False)
+        assert clk_out.value == 0
         if i != instr_len - 1:
-            if ok_to_exit and dut.qspi_flash_select.value == 1:
+            if ok_to_exit and flash_select.value == 1:
                 return
-            assert dut.qspi_flash_select.value == 0
+            assert flash_select.value == 0
 
 async def expect_load(dut, addr, val, bytes=4):
     if addr >= 0x1800000:
@@ -112,16 +112,7 @@ class TinyQV:
     # If sync is false this function will return before the store is completed.
     async def write_word_reg(self, reg, value, sync=True):
         await test_util.stop_nops()
-
-        # Prepare value for LUI + ADDI
-        value_upper = ((value + 0x800) >> 12) & 0xfffff
-        value_lower = value & 0xfff
-        if value_lower >= 0x800:
-            value_lower -= 0x1000
-
-        await test_util.send_instr(self.dut, InstructionLUI(a1, value_upper).encode())
-        await test_util.send_instr(self.dut, InstructionADDI(a1, a1, value_lower).encode())
-        await test_util.send_instr(self.dut, InstructionSW(tp, a1, self.base_address + reg).encode())
+        await self._send_word_store(reg, value)
 
         if sync:
             # Read a register in order to ensure the store is complete before returning
@@ -139,6 +130,45 @@ class TinyQV:
         await test_util.start_nops(self.dut)
         return val
 
+    # Write several word registers in your design in one go
+    # pairs is a list of (reg, value) tuples, written in order
+    # The nops are only stopped once, and if sync is true only the
+    # last store is waited for, as the stores complete in order.
+    async def write_words(self, pairs, sync=True):
+        await test_util.stop_nops()
+        for reg, value in pairs:
+            await self._send_word_store(reg, value)
+
+        if sync and pairs:
+            # Read a register in order to ensure the stores are complete before returning
+            assert await test_util.read_reg(self.dut, a1) == pairs[-1][1]
+
+        await test_util.start_nops(self.dut)
+
+    # Read several word registers from your design in one go
+    # regs is a list of register addresses in the range 0-15
+    # The returned value is a list of the data read from each register
+    async def read_words(self, regs):
+        await test_util.stop_nops()
+        vals = []
+        for reg in regs:
+            await test_util.send_instr(self.dut, InstructionLW(a1, tp, self.base_address + reg).encode())
+            vals.append(await test_util.read_reg(self.dut, a1, True))
+        await test_util.start_nops(self.dut)
+        return vals
+
+    # Send the instructions to store a word to a register, without waiting for completion
+    async def _send_word_store(self, reg, value):
+        # Prepare value for LUI + ADDI
+        value_upper = ((value + 0x800) >> 12) & 0xfffff
+        value_lower = value & 0xfff
+        if value_lower >= 0x800:
+            value_lower -= 0x1000
+
+        await test_util.send_instr(self.dut, InstructionLUI(a1, value_upper).encode())
+        await test_util.send_instr(self.dut, InstructionADDI(a1, a1, value_lower).encode())
+        await test_util.send_instr(self.dut, InstructionSW(tp, a1, self.base_address + reg).encode())
+
     # Check whether the user interrupt is asserted
     async def is_interrupt_asserted(self):
         await test_util.stop_nops()
@@ -0,0 +1,21 @@
+// SPDX-FileCopyrightText: © 2025 Andreas Wendleder
+// SPDX-License-Identifier: CERN-OHL-S-2.0
+
+`default_nettype none `timescale 1ns / 1ps
+
+/* Free-running clock generated in the simulator, so that cocotb does not
+   have to resume a Python coroutine on every clock edge.
+   Selected by building with COCOTB_HDL_CLOCK=1, see test_basic.mk.
+   The default 15.624ns period matches the cocotb Clock fallback in test.py,
+   and leaves margin over the unit delay used by the gate level test.
+*/
+module hdl_clock #(
+    parameter HALF_PERIOD = 7.812
+) (
+    output reg clk
+);
+
+  initial clk = 1'b0;
+  always #HALF_PERIOD clk = ~clk;
+
+endmodule
@@ -1,61 +1,92 @@
 # SPDX-FileCopyrightText: © 2025 Andreas Wendleder
 # SPDX-License-Identifier: CERN-OHL-S-2.0
 
+import math
+import os
 import cocotb
 from cocotb.clock import Clock
+import numpy as np
 from tqv import TinyQV
-import struct
+
+# When set, tb.v is built with hdl_clock.v driving clk, see test_basic.mk
+HDL_CLOCK = os.environ.get("COCOTB_HDL_CLOCK") == "1"
+
+# One 4 byte scratch buffer viewed as both FP32 and uint32, so that
+# conversions are an in-place store and load with no allocation
+_BUF = bytearray(4)
+_MF = memoryview(_BUF).cast('f')
+_MI = memoryview(_BUF).cast('I')
 
 def float_to_bits(f):
-    return struct.unpack('<I', struct.pack('<f', f))[0]
+    _MF[0] = f
+    bits = _MI[0]
+    # Unlike struct.pack('<f'), the store silently rounds out of range values
+    # to inf, so raise the same error to catch typos in the test vectors
+    if (bits & 0x7FFFFFFF) == 0x7F800000 and not math.isinf(f):
+        raise OverflowError(f"{f} is out of range for FP32")
+    return bits
 
 def bits_to_float(b):
-    return struct.unpack('<f', struct.pack('<I', b & 0xFFFFFFFF))[0]
+    _MI[0] = b & 0xFFFFFFFF
+    return _MF[0]
 
 PERIPHERAL_NUM = 39
 
+# Unified Address Map
+ADDR_A, ADDR_B, ADDR_RESULT = 0, 4, 8
+
+# Operand pairs, all checked after a single reset
+TEST_PAIRS = [
+    (1.25, 2.5),
+    (10.0, 20.0),
+    (0.1, 0.2),
+    (-5.5, 2.25),
+    (100.0, 0.0),
+    (1.23e-2, 4.56e-2)
+]
+
+def fp32_sum_bits(bits_a, bits_b):
+    # Add in np.float32, so the sum is rounded to nearest even like the adder
+    a, b = np.array([bits_a, bits_b], dtype=np.uint32).view(np.float32)
+    return int((a + b).view(np.uint32))
+
+# Operand bit patterns, converted once at import
+TEST_OPERANDS_U32 = [(float_to_bits(a), float_to_bits(b)) for a, b in TEST_PAIRS]
+
+# Raw integer operands, which are subnormal floats that add exactly
+RAW_OPERANDS_U32 = [(0x42, 0x01)]
+
+# (bits of a, bits of b, bits of the FP32 sum)
+TEST_VECTORS_U32 = tuple(
+    (bits_a, bits_b, fp32_sum_bits(bits_a, bits_b))
+    for bits_a, bits_b in TEST_OPERANDS_U32 + RAW_OPERANDS_U32
+)
+
 @cocotb.test()
 async def test_borg_float_addition(dut):
     dut._log.info("Starting Borg Floating Point Addition Test")
 
-    clock = Clock(dut.clk, 100, unit="ns")
-    cocotb.start_soon(clock.start())
+    if not HDL_CLOCK:
+        clock = Clock(dut.clk, 15.624, unit="ns")
+        cocotb.start_soon(clock.start())
     tqv = TinyQV(dut, PERIPHERAL_NUM)
     await tqv.reset()
 
-    # Unified Address Map
-    ADDR_A, ADDR_B, ADDR_RESULT = 0, 4, 8
-    EPSILON = 1e-6
-
-    val_a, val_b = 1.25, 2.5
-    expected_sum = val_a + val_b
-
-    await tqv.write_word_reg(ADDR_A, float_to_bits(val_a))
-    await tqv.write_word_reg(ADDR_B, float_to_bits(val_b))
-    
-    actual_bits = await tqv.read_word_reg(ADDR_RESULT)
-    actual_float = bits_to_float(actual_bits)
-    
-    dut._log.info(f"Initial Check: {val_a} + {val_b} = {actual_float}")
-    assert abs(actual_float - expected_sum) < EPSILON, f"Failed: Got {actual_float}"
-
-    read_bits_a = await tqv.read_word_reg(ADDR_A)
-    assert read_bits_a == float_to_bits(val_a), "Operand A corrupted!"
-
-    test_pairs = [
-        (10.0, 20.0),
-        (0.1, 0.2),
-        (-5.5, 2.25),
-        (100.0, 0.0),
-        (1.23e-2, 4.56e-2)
-    ]
-
-    for a, b in test_pairs:
-        await tqv.write_word_reg(ADDR_A, float_to_bits(a))
-        await tqv.write_word_reg(ADDR_B, float_to_bits(b))
-        res = bits_to_float(await tqv.read_word_reg(ADDR_RESULT))
-
-        assert abs(res - (a + b)) < EPSILON, f"Iter failed: {a} + {b} = {res}"
-        dut._log.info(f"Passed: {a} + {b} = {res}")
+    for bits_a, bits_b, expected_bits in TEST_VECTORS_U32:
+        await tqv.write_words([(ADDR_A, bits_a), (ADDR_B, bits_b)])
+        # No wait needed: the sum is registered one cycle after the operand
+        # write, and the synchronous write has already taken many cycles.
+        res_bits = await tqv.read_word_reg(ADDR_RESULT)
+
+        assert res_bits == expected_bits, \
+            f"Iter failed: {bits_to_float(bits_a)} + {bits_to_float(bits_b)} = {res_bits:#010x}, expected {expected_bits:#010x}"
+        dut._log.debug("Passed: %#010x + %#010x = %#010x", bits_a, bits_b, res_bits)
+
+    # The result and operand A must still hold the values from the last
+    # test vector, read back to back in one go
+    last_bits_a, _, last_expected_bits = TEST_VECTORS_U32[-1]
+    read_bits_res, read_bits_a = await tqv.read_words([ADDR_RESULT, ADDR_A])
+    assert read_bits_res == last_expected_bits, "Result corrupted!"
+    assert read_bits_a == last_bits_a, "Operand A corrupted!"
 
     dut._log.info("Borg Floating Point Addition Test Passed!")